@@ -3,7 +3,16 @@
 from .data_loader import load_lending_club_data, get_basic_info
 from .data_cleaner import clean_lending_club_data
 from .analyzer import calculate_grade_metrics, calculate_portfolio_metrics
-from .visualizer import plot_default_rate_by_grade, plot_risk_return_analysis
+
+# Plotting functions are loaded on first access so analysis-only callers
+# don't pay for importing matplotlib and seaborn
+_PLOT_NAMES = ('plot_default_rate_by_grade', 'plot_risk_return_analysis')
+
+def __getattr__(name):
+    if name in _PLOT_NAMES:
+        from . import visualizer
+        return getattr(visualizer, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'load_lending_club_data',
@@ -0,0 +1,85 @@
+"""
+Compiled numeric kernels for large-N analysis passes.
+
+Numba is optional: when it is not installed or fails to import, or the input
+is too small to repay the JIT compile, the kernels fall back to equivalent
+vectorized NumPy implementations.
+"""
+
+import importlib.util
+import numpy as np
+from typing import Tuple
+
+# Checked without importing numba; the import itself is deferred to the
+# first kernel call so importing the package stays cheap (and is cleared
+# there if numba turns out to be installed but not importable)
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+# Row count from which the Numba kernel is used. Compiling it costs ~1-1.5 s
+# per process while saving only ~7 ns/row over the NumPy path, so smaller
+# inputs (the full Lending Club extract is ~1.3M completed loans) stay on NumPy
+NUMBA_MIN_ROWS = 100_000_000
+
+# Compiled Numba kernel, built on first use
+_impact_kernel = None
+
+def _compile_impact_kernel():
+    """Import numba and JIT-compile the business-impact kernel."""
+    from numba import njit, prange
+    
+    # No on-disk cache: it records the importing module name, so a cache built
+    # via `import src` breaks the notebook's flat `import analyzer` and vice versa
+    @njit(parallel=True, fastmath=True)
+    def kernel(amt, rate, is_default, grade_code, high_risk_min_code):
+        tot_def = 0.0
+        hr_def = 0.0
+        rev = 0.0
+        for i in prange(len(amt)):
+            rev += amt[i] * rate[i]
+            if is_default[i]:
+                tot_def += amt[i]
+                if grade_code[i] >= high_risk_min_code:
+                    hr_def += amt[i]
+        return tot_def, hr_def, rev * 0.01
+    
+    return kernel
+
+
+def impact_kernel(amt: np.ndarray, rate: np.ndarray, is_default: np.ndarray,
+                  grade_code: np.ndarray, high_risk_min_code: int) -> Tuple[float, float, float]:
+    """
+    Single streaming pass over the business-impact inputs.
+
+    The compiled Numba kernel is only used from NUMBA_MIN_ROWS rows (100M);
+    below that the NumPy path is faster once the JIT compile is counted.
+
+    Args:
+        amt: Loan amounts
+        rate: Interest rates (%)
+        is_default: Default flags
+        grade_code: Categorical grade codes
+        high_risk_min_code: Lowest grade code treated as high risk
+
+    Returns:
+        Tuple of (total default volume, high-risk default volume, interest revenue)
+    """
+    global _impact_kernel, NUMBA_AVAILABLE
+    if NUMBA_AVAILABLE and len(amt) >= NUMBA_MIN_ROWS and _impact_kernel is None:
+        try:
+            _impact_kernel = _compile_impact_kernel()
+        except ImportError:
+            # A broken numba install (e.g. built against another NumPy):
+            # don't retry, use the NumPy path from now on
+            NUMBA_AVAILABLE = False
+    if NUMBA_AVAILABLE and len(amt) >= NUMBA_MIN_ROWS:
+        tot_def, hr_def, rev = _impact_kernel(amt, rate, is_default, grade_code,
+                                              high_risk_min_code)
+        return float(tot_def), float(hr_def), float(rev)
+
+    # Masked sums as BLAS dot products against 0/1 weights
+    defm = is_default.astype(np.float64)
+    high_risk = (grade_code >= high_risk_min_code).astype(np.float64)
+    tot_def = defm @ amt
+    hr_def = (defm * high_risk) @ amt
+    rev = (amt @ rate) / 100
+    return float(tot_def), float(hr_def), float(rev)
@@ -6,6 +6,28 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 
+try:
+    from .data_cleaner import GRADE_ORDER, as_grade_categorical
+    from ._kernels import impact_kernel
+except ImportError:  # modules imported directly from src/ (e.g. the notebook)
+    from data_cleaner import GRADE_ORDER, as_grade_categorical
+    from _kernels import impact_kernel
+
+# Grades treated as high risk; they are the last categories in GRADE_ORDER,
+# so membership is a single comparison on the categorical codes
+HIGH_RISK_GRADES = ['F', 'G']
+_HIGH_RISK_MIN_CODE = GRADE_ORDER.index(HIGH_RISK_GRADES[0])
+
+def _aggregation_frame(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Select the columns an aggregation reads, with float columns upcast to
+    float64 so reported sums, means and medians don't inherit float32
+    rounding (the cleaned frame stores them as float32).
+    """
+    columns = [col for col in columns if col in df.columns]
+    return df[columns].astype({col: np.float64 for col in columns
+                               if df[col].dtype.kind == 'f'})
+
 def calculate_grade_metrics(df: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate comprehensive metrics by loan grade.
@@ -18,43 +40,47 @@ def calculate_grade_metrics(df: pd.DataFrame) -> pd.DataFrame:
     """
     print("Calculating metrics for each loan grade...")
     
-    # Core aggregations by grade
-    grade_agg = df.groupby('grade').agg({
-        'is_default': ['count', 'sum', 'mean'],
-        'loan_amnt': ['mean', 'median', 'std', 'sum'],
-        'int_rate': ['mean', 'median', 'std'],
-        'annual_inc': ['mean', 'median']
-    }).round(4)
-    
-    # Flatten multi-level column names
-    grade_agg.columns = ['_'.join(col) for col in grade_agg.columns]
-    
-    # Rename for clarity
-    grade_metrics = grade_agg.rename(columns={
-        'is_default_count': 'total_loans',
-        'is_default_sum': 'num_defaults',
-        'is_default_mean': 'default_rate',
-        'loan_amnt_mean': 'avg_loan_amount',
-        'loan_amnt_median': 'median_loan_amount',
-        'loan_amnt_std': 'std_loan_amount',
-        'loan_amnt_sum': 'total_volume',
-        'int_rate_mean': 'avg_interest_rate',
-        'int_rate_median': 'median_interest_rate',
-        'int_rate_std': 'std_interest_rate',
-        'annual_inc_mean': 'avg_annual_income',
-        'annual_inc_median': 'median_annual_income'
-    })
-    
-    # Add derived metrics
-    grade_metrics['default_rate_pct'] = (grade_metrics['default_rate'] * 100).round(2)
-    grade_metrics['volume_share_pct'] = (
-        (grade_metrics['total_volume'] / grade_metrics['total_volume'].sum()) * 100
-    ).round(2)
+    # Core aggregations by grade in a single groupby pass; the small result
+    # is sorted afterwards so grades stay in A-G order
+    agg_df = _aggregation_frame(df, ['grade', 'is_default', 'loan_amnt', 'int_rate', 'annual_inc'])
+    gb = agg_df.groupby('grade', sort=False, observed=True)
+    grade_metrics = gb.agg(
+        total_loans=('is_default', 'size'),
+        num_defaults=('is_default', 'sum'),
+        avg_loan_amount=('loan_amnt', 'mean'),
+        median_loan_amount=('loan_amnt', 'median'),
+        std_loan_amount=('loan_amnt', 'std'),
+        total_volume=('loan_amnt', 'sum'),
+        avg_interest_rate=('int_rate', 'mean'),
+        median_interest_rate=('int_rate', 'median'),
+        std_interest_rate=('int_rate', 'std'),
+        avg_annual_income=('annual_inc', 'mean'),
+        median_annual_income=('annual_inc', 'median')
+    ).sort_index()
+    
+    # Derived metrics computed on the underlying arrays (no Series alignment);
+    # default rate comes from the counts instead of a separate mean pass
+    num_defaults = grade_metrics['num_defaults'].to_numpy()
+    total_loans = grade_metrics['total_loans'].to_numpy()
+    total_volume = grade_metrics['total_volume'].to_numpy()
+    avg_interest_rate = grade_metrics['avg_interest_rate'].to_numpy()
+    
+    default_rate = num_defaults / total_loans
+    grade_metrics.insert(2, 'default_rate', default_rate)
+    
+    # Add derived metrics (display columns rounded in place; the aggregated
+    # columns keep full precision)
+    default_rate_pct = default_rate * 100
+    volume_share_pct = total_volume / total_volume.sum() * 100
     
     # Calculate risk-adjusted return (simplified)
-    grade_metrics['expected_return_pct'] = (
-        grade_metrics['avg_interest_rate'] * (1 - grade_metrics['default_rate'])
-    ).round(2)
+    expected_return_pct = avg_interest_rate * (1 - default_rate)
+    
+    for arr in (default_rate_pct, volume_share_pct, expected_return_pct):
+        np.round(arr, 2, out=arr)
+    grade_metrics['default_rate_pct'] = default_rate_pct
+    grade_metrics['volume_share_pct'] = volume_share_pct
+    grade_metrics['expected_return_pct'] = expected_return_pct
     
     grade_metrics = grade_metrics.reset_index()
     
@@ -77,25 +103,31 @@ def calculate_subgrade_metrics(df: pd.DataFrame) -> pd.DataFrame:
     
     print("Calculating metrics for each sub-grade...")
     
-    subgrade_metrics = df.groupby(['grade', 'sub_grade']).agg({
-        'is_default': ['count', 'sum', 'mean'],
-        'loan_amnt': ['mean', 'sum'],
-        'int_rate': 'mean'
-    }).round(4)
-    
-    # Flatten columns
-    subgrade_metrics.columns = ['_'.join(col) for col in subgrade_metrics.columns]
-    subgrade_metrics = subgrade_metrics.rename(columns={
-        'is_default_count': 'total_loans',
-        'is_default_sum': 'num_defaults', 
-        'is_default_mean': 'default_rate',
-        'loan_amnt_mean': 'avg_loan_amount',
-        'loan_amnt_sum': 'total_volume',
-        'int_rate_mean': 'avg_interest_rate'
-    })
-    
-    subgrade_metrics['default_rate_pct'] = (subgrade_metrics['default_rate'] * 100).round(2)
+    # One groupby on sub_grade only; the grade is the sub-grade's first letter
+    agg_df = _aggregation_frame(df, ['sub_grade', 'is_default', 'loan_amnt', 'int_rate'])
+    subgrade_metrics = agg_df.groupby('sub_grade', sort=False, observed=True).agg(
+        total_loans=('is_default', 'size'),
+        num_defaults=('is_default', 'sum'),
+        total_volume=('loan_amnt', 'sum'),
+        avg_interest_rate=('int_rate', 'mean')
+    ).sort_index()
+    
+    # Means derived from the sums instead of extra aggregation passes
+    num_defaults = subgrade_metrics['num_defaults'].to_numpy()
+    total_loans = subgrade_metrics['total_loans'].to_numpy()
+    total_volume = subgrade_metrics['total_volume'].to_numpy()
+    
+    default_rate = num_defaults / total_loans
+    subgrade_metrics.insert(2, 'default_rate', default_rate)
+    subgrade_metrics.insert(3, 'avg_loan_amount', total_volume / total_loans)
+    
+    default_rate_pct = default_rate * 100
+    np.round(default_rate_pct, 2, out=default_rate_pct)
+    subgrade_metrics['default_rate_pct'] = default_rate_pct
     subgrade_metrics = subgrade_metrics.reset_index()
+    subgrade_metrics.insert(
+        0, 'grade', as_grade_categorical(subgrade_metrics['sub_grade'].astype(str).str[0])
+    )
     
     print(f"Done. Metrics calculated for {len(subgrade_metrics)} sub-grades.")
     return subgrade_metrics
@@ -110,27 +142,39 @@ def calculate_portfolio_metrics(df: pd.DataFrame) -> Dict:
     Returns:
         Dictionary with portfolio statistics
     """
+    # 0/1 default flags as float64 so masked sums become a single BLAS dot
+    defm = df['is_default'].to_numpy(dtype=np.float64)
+    amt = df['loan_amnt'].to_numpy(dtype=np.float64)
+    
+    # Reduce each column once and derive the remaining figures from the scalars
+    total_loans = len(defm)
+    total_defaults = int(defm.sum())
+    total_volume = amt.sum()
+    overall_default_rate = total_defaults / total_loans
+    
     portfolio = {
-        'total_loans': len(df),
-        'total_volume': df['loan_amnt'].sum(),
-        'avg_loan_size': df['loan_amnt'].mean(),
-        'overall_default_rate': df['is_default'].mean(),
-        'overall_default_rate_pct': (df['is_default'].mean() * 100),
-        'avg_interest_rate': df['int_rate'].mean(),
-        'total_defaults': df['is_default'].sum(),
-        'default_volume': df[df['is_default'] == 1]['loan_amnt'].sum()
+        'total_loans': total_loans,
+        'total_volume': total_volume,
+        'avg_loan_size': total_volume / total_loans,
+        'overall_default_rate': overall_default_rate,
+        'overall_default_rate_pct': overall_default_rate * 100,
+        'avg_interest_rate': df['int_rate'].to_numpy(dtype=np.float64).mean(),
+        'total_defaults': total_defaults,
+        'default_volume': float(defm @ amt)
     }
     
-    # Risk concentration metrics
-    grade_concentration = df['grade'].value_counts(normalize=True).max()
-    portfolio['max_grade_concentration_pct'] = (grade_concentration * 100)
+    grade_codes = as_grade_categorical(df['grade']).cat.codes.to_numpy()
+    
+    # Risk concentration metrics (codes shifted by one so missing grades,
+    # coded -1, land in a bin that is dropped)
+    grade_counts = np.bincount(grade_codes + 1, minlength=len(GRADE_ORDER) + 1)[1:]
+    portfolio['max_grade_concentration_pct'] = grade_counts.max() * 100.0 / grade_counts.sum()
     
     # High-risk exposure (grades F, G)
-    high_risk_grades = ['F', 'G']
-    high_risk_mask = df['grade'].isin(high_risk_grades)
+    high_risk_mask = grade_codes >= _HIGH_RISK_MIN_CODE
     portfolio['high_risk_loans_pct'] = (high_risk_mask.mean() * 100)
     portfolio['high_risk_volume_pct'] = (
-        df[high_risk_mask]['loan_amnt'].sum() / df['loan_amnt'].sum() * 100
+        amt[high_risk_mask].sum() / total_volume * 100
     )
     
     print("Portfolio Overview:")
@@ -152,18 +196,23 @@ def analyze_risk_return_relationship(grade_metrics: pd.DataFrame) -> Dict:
     Returns:
         Dictionary with risk-return analysis
     """
-    # Calculate correlation between default rate and interest rate
-    correlation = grade_metrics['default_rate'].corr(grade_metrics['avg_interest_rate'])
+    x = grade_metrics['default_rate'].to_numpy()
+    y = grade_metrics['avg_interest_rate'].to_numpy()
+    grades = grade_metrics['grade'].to_numpy()
+    
+    # Calculate correlation between default rate and interest rate (Pearson)
+    correlation = ((x - x.mean()) * (y - y.mean())).sum() / (x.std() * y.std() * len(x))
     
     # Find grades with poor risk-return tradeoff
     # (high default rate but not proportionally high interest rate)
-    grade_metrics['risk_premium'] = grade_metrics['avg_interest_rate'] - grade_metrics['default_rate_pct']
+    risk_premium = y - grade_metrics['default_rate_pct'].to_numpy()
+    grade_metrics['risk_premium'] = risk_premium
     
     analysis = {
         'risk_return_correlation': correlation,
-        'avg_risk_premium': grade_metrics['risk_premium'].mean(),
-        'worst_risk_return_grade': grade_metrics.loc[grade_metrics['risk_premium'].idxmin(), 'grade'],
-        'best_risk_return_grade': grade_metrics.loc[grade_metrics['risk_premium'].idxmax(), 'grade']
+        'avg_risk_premium': risk_premium.mean(),
+        'worst_risk_return_grade': grades[risk_premium.argmin()],
+        'best_risk_return_grade': grades[risk_premium.argmax()]
     }
     
     print("Risk-Return Analysis:")
@@ -186,21 +235,17 @@ def identify_risk_thresholds(grade_metrics: pd.DataFrame,
     Returns:
         Dictionary with risk threshold analysis
     """
-    high_risk_grades = grade_metrics[
-        grade_metrics['default_rate_pct'] > acceptable_default_rate
-    ]['grade'].tolist()
+    rates = grade_metrics['default_rate_pct'].to_numpy()
+    volumes = grade_metrics['total_volume'].to_numpy()
+    grades = grade_metrics['grade'].to_numpy()
     
-    acceptable_grades = grade_metrics[
-        grade_metrics['default_rate_pct'] <= acceptable_default_rate
-    ]['grade'].tolist()
+    # One mask drives the grade lists and the exposure calculation
+    high = rates > acceptable_default_rate
+    high_risk_grades = grades[high].tolist()
+    acceptable_grades = grades[~high].tolist()
     
     # Calculate exposure to high-risk grades
-    high_risk_volume = grade_metrics[
-        grade_metrics['grade'].isin(high_risk_grades)
-    ]['total_volume'].sum()
-    
-    total_volume = grade_metrics['total_volume'].sum()
-    high_risk_exposure_pct = (high_risk_volume / total_volume) * 100
+    high_risk_exposure_pct = (volumes[high].sum() / volumes.sum()) * 100
     
     analysis = {
         'acceptable_default_rate': acceptable_default_rate,
@@ -229,16 +274,16 @@ def calculate_business_impact(df: pd.DataFrame, grade_metrics: pd.DataFrame) ->
     Returns:
         Dictionary with business impact calculations
     """
-    # Calculate potential loss reduction from eliminating high-risk grades
-    high_risk_grades = ['F', 'G']
-    high_risk_defaults = df[
-        (df['grade'].isin(high_risk_grades)) & (df['is_default'] == 1)
-    ]['loan_amnt'].sum()
-    
-    total_defaults_value = df[df['is_default'] == 1]['loan_amnt'].sum()
-    
-    # Revenue impact of different strategies
-    total_interest_revenue = (df['loan_amnt'] * df['int_rate'] / 100).sum()
+    amt = df['loan_amnt'].to_numpy(dtype=np.float64)
+    rate = df['int_rate'].to_numpy(dtype=np.float64)
+    defm = df['is_default'].to_numpy(dtype=bool)
+    grade_codes = as_grade_categorical(df['grade']).cat.codes.to_numpy()
+    
+    # Default losses (all and high-risk grades) and interest revenue in one
+    # streaming pass; compiled with Numba when it is installed
+    total_defaults_value, high_risk_defaults, total_interest_revenue = impact_kernel(
+        amt, rate, defm, grade_codes, _HIGH_RISK_MIN_CODE
+    )
     
     impact = {
         'total_default_losses': total_defaults_value,
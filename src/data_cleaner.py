@@ -2,18 +2,54 @@
 Data cleaning functions for Lending Club analysis.
 """
 
+import importlib.util
 import pandas as pd
 import numpy as np
 from typing import List, Tuple, Optional
 
+# polars is optional and only imported by the functions that use it
+POLARS_AVAILABLE = importlib.util.find_spec('polars') is not None
+
 # Define essential columns for the analysis
 ESSENTIAL_COLUMNS = [
     'grade', 'sub_grade', 'loan_status', 'loan_amnt', 
     'int_rate', 'annual_inc', 'emp_length', 'purpose'
 ]
 
-# Define completed loan statuses for default analysis
-COMPLETED_STATUSES = ['Fully Paid', 'Charged Off', 'Default']
+# Define completed loan statuses for default analysis (frozensets so
+# membership tests don't rebuild a hash set on every call)
+COMPLETED_STATUSES = frozenset({'Fully Paid', 'Charged Off', 'Default'})
+DEFAULT_STATUSES = frozenset({'Charged Off', 'Default'})
+
+# Loan grades from lowest to highest risk
+GRADE_ORDER = ['A', 'B', 'C', 'D', 'E', 'F', 'G']
+GRADE_DTYPE = pd.CategoricalDtype(categories=GRADE_ORDER, ordered=True)
+
+# Low-cardinality string columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ['sub_grade', 'loan_status', 'emp_length', 'purpose']
+
+# Employment length strings mapped to numeric years (unlisted values -> NaN)
+EMP_LENGTH_MAP = {
+    '< 1 year': 0.5,
+    '1 year': 1.0,
+    '2 years': 2.0,
+    '3 years': 3.0,
+    '4 years': 4.0,
+    '5 years': 5.0,
+    '6 years': 6.0,
+    '7 years': 7.0,
+    '8 years': 8.0,
+    '9 years': 9.0,
+    '10+ years': 10.0
+}
+
+# Strings polars should read as null, mirroring pandas' default NA values
+POLARS_NULL_VALUES = ['', 'NA', 'N/A', 'n/a', 'NaN', 'nan', 'null', 'NULL']
+
+# Numeric columns stored as float32 after cleaning (ample precision for
+# means and ratios, half the memory bandwidth of float64). int_rate stays
+# float64: it is small, and float32 would turn e.g. 16.46 into 16.459999
+FLOAT32_COLUMNS = ['loan_amnt', 'annual_inc', 'emp_length_years']
 
 def clean_lending_club_data(df: pd.DataFrame, 
                            focus_columns: Optional[List[str]] = None) -> pd.DataFrame:
@@ -27,123 +63,286 @@ def clean_lending_club_data(df: pd.DataFrame,
     Returns:
         Cleaned DataFrame ready for analysis
     """
+    df_clean = clean_lending_club_data_streaming(df, focus_columns)
+    
+    # Step 8: Handle remaining missing values
+    df_clean = handle_missing_values(df_clean)
+    
+    # Step 9: Downcast numeric columns for the analysis hot paths
+    df_clean = downcast_numeric_columns(df_clean)
+    
+    print(f"Final cleaned dataset: {df_clean.shape[0]:,} rows × {df_clean.shape[1]} columns")
+    print("Cleaning done.")
+    
+    return df_clean
+
+def clean_lending_club_data_streaming(df: pd.DataFrame,
+                                      focus_columns: Optional[List[str]] = None,
+                                      verbose: bool = True) -> pd.DataFrame:
+    """
+    Row-local cleaning steps (selection, filtering, parsing, default flag).
+    
+    Every step here only looks at its own rows, so it can run on independent
+    chunks of the CSV; the median imputation in handle_missing_values needs
+    the combined data and is left to the caller.
+    
+    Args:
+        df: Raw Lending Club DataFrame (or one chunk of it)
+        focus_columns: Columns to focus on (uses ESSENTIAL_COLUMNS if None)
+        verbose: Print progress (turned off when cleaning many chunks)
+    
+    Returns:
+        Partially cleaned DataFrame (missing values not yet imputed)
+    """
     if focus_columns is None:
         focus_columns = ESSENTIAL_COLUMNS
     
-    print("Starting data cleaning...")
-    print(f"Rows before cleaning: {df.shape[0]:,}")
+    n_rows = len(df)
+    if verbose:
+        print("Starting data cleaning...")
+        print(f"Rows before cleaning: {n_rows:,}")
     
     # Step 1: Select essential columns (if they exist)
     available_cols = [col for col in focus_columns if col in df.columns]
     missing_cols = [col for col in focus_columns if col not in df.columns]
     
-    if missing_cols:
+    if missing_cols and verbose:
         print(f"Missing columns: {missing_cols}")
     
+    # The one owned copy; every cleaning helper below modifies it in place
     df_clean = df[available_cols].copy()
-    print(f"After column selection: {df_clean.shape[0]:,} rows × {df_clean.shape[1]} columns")
-    
-    # Step 2: Remove rows with missing critical values
-    critical_cols = ['grade', 'loan_status']
-    before_critical = len(df_clean)
-    df_clean = df_clean.dropna(subset=critical_cols)
-    print(f"After dropping missing grade/status: {df_clean.shape[0]:,} rows "
-          f"(removed {before_critical - len(df_clean):,})")
-    
-    # Step 3: Focus on completed loans for default analysis
-    before_status = len(df_clean)
-    df_clean = df_clean[df_clean['loan_status'].isin(COMPLETED_STATUSES)]
-    print(f"After filtering to completed loans: {df_clean.shape[0]:,} rows "
-          f"(removed {before_status - len(df_clean):,})")
-    
-    # Step 4: Clean interest rate column
+    if verbose:
+        print(f"After column selection: {n_rows:,} rows × {len(available_cols)} columns")
+    
+    # Step 2: Encode low-cardinality strings as categoricals (grade ordered A-G)
+    df_clean = encode_categorical_columns(df_clean, verbose)
+    
+    # Steps 3-4: Drop rows missing grade/status and keep completed loans
+    # for default analysis, applied as one combined mask (a single copy)
+    has_critical = (df_clean['grade'].notna() & df_clean['loan_status'].notna()).to_numpy()
+    is_completed = _status_mask(df_clean['loan_status'], COMPLETED_STATUSES)
+    keep = has_critical & is_completed
+    n_critical = int(has_critical.sum())
+    n_kept = int(keep.sum())
+    df_clean = df_clean.loc[keep]
+    # Drop categories only the filtered-out rows used (e.g. 'Current'), so
+    # every load path ends up with the same dtypes; grade keeps GRADE_DTYPE
+    for col in CATEGORICAL_COLUMNS:
+        if col in df_clean.columns:
+            df_clean[col] = df_clean[col].cat.remove_unused_categories()
+    if verbose:
+        print(f"After dropping missing grade/status: {n_critical:,} rows "
+              f"(removed {n_rows - n_critical:,})")
+        print(f"After filtering to completed loans: {n_kept:,} rows "
+              f"(removed {n_critical - n_kept:,})")
+    
+    # Step 5: Clean interest rate column
     if 'int_rate' in df_clean.columns:
-        df_clean = clean_interest_rate(df_clean)
+        df_clean = clean_interest_rate(df_clean, verbose)
     
-    # Step 5: Create default indicator
-    df_clean = add_default_indicator(df_clean)
+    # Step 6: Create default indicator. Only completed loans remain, so a
+    # loan defaulted unless it was fully paid (one comparison on the codes)
+    df_clean['is_default'] = (df_clean['loan_status'] != 'Fully Paid').to_numpy()
+    df_clean = add_default_indicator(df_clean, verbose)
     
-    # Step 6: Clean employment length
+    # Step 7: Clean employment length
     if 'emp_length' in df_clean.columns:
-        df_clean = clean_employment_length(df_clean)
+        df_clean = clean_employment_length(df_clean, verbose)
     
-    # Step 7: Handle remaining missing values
-    df_clean = handle_missing_values(df_clean)
+    return df_clean
+
+def clean_lending_club_data_polars(filepath: str,
+                                   focus_columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Load and clean a Lending Club CSV in one multi-threaded polars query.
+    
+    Same steps as clean_lending_club_data, expressed as a LazyFrame so the
+    column projection is pushed into the scan and the filters are fused.
+    
+    Args:
+        filepath: Path to the Lending Club CSV file
+        focus_columns: Columns to focus on (uses ESSENTIAL_COLUMNS if None)
+    
+    Returns:
+        Cleaned pandas DataFrame with the same columns and dtypes as
+        clean_lending_club_data
+    """
+    if not POLARS_AVAILABLE:
+        raise ImportError("clean_lending_club_data_polars requires the polars package")
+    import polars as pl
+    
+    if focus_columns is None:
+        focus_columns = ESSENTIAL_COLUMNS
+    
+    print("Starting data cleaning (polars)...")
+    
+    lf = pl.scan_csv(filepath, null_values=POLARS_NULL_VALUES)
+    schema = lf.collect_schema()
+    available_cols = [col for col in focus_columns if col in schema]
+    missing_cols = [col for col in focus_columns if col not in schema]
+    
+    if missing_cols:
+        print(f"Missing columns: {missing_cols}")
+    
+    lf = (
+        lf.select(available_cols)
+        .drop_nulls(['grade', 'loan_status'])
+        .filter(pl.col('loan_status').is_in(COMPLETED_STATUSES))
+    )
+    
+    columns = [pl.col('loan_status').is_in(DEFAULT_STATUSES).alias('is_default')]
+    if 'int_rate' in available_cols:
+        int_rate = pl.col('int_rate')
+        if schema['int_rate'] == pl.String:
+            int_rate = int_rate.str.strip_chars_end('%')
+        columns.append(int_rate.cast(pl.Float64))
+    if 'emp_length' in available_cols:
+        columns.append(
+            pl.col('emp_length')
+            .replace_strict(EMP_LENGTH_MAP, default=None, return_dtype=pl.Float32)
+            .alias('emp_length_years')
+        )
+    columns.extend(pl.col(col).cast(pl.Float32)
+                   for col in ('loan_amnt', 'annual_inc') if col in available_cols)
+    lf = lf.with_columns(columns)
+    
+    # Median imputation (income by grade, employment years overall)
+    fills = []
+    if 'annual_inc' in available_cols:
+        fills.append(pl.col('annual_inc').fill_null(pl.col('annual_inc').median().over('grade')))
+    if 'emp_length' in available_cols:
+        fills.append(pl.col('emp_length_years').fill_null(pl.col('emp_length_years').median()))
+    if fills:
+        lf = lf.with_columns(fills)
+    
+    df_clean = lf.collect(engine='streaming').to_pandas()
+    df_clean = encode_categorical_columns(df_clean)
     
     print(f"Final cleaned dataset: {df_clean.shape[0]:,} rows × {df_clean.shape[1]} columns")
     print("Cleaning done.")
     
     return df_clean
 
-def clean_interest_rate(df: pd.DataFrame) -> pd.DataFrame:
+def as_grade_categorical(grades: pd.Series) -> pd.Series:
     """
-    Clean interest rate column (remove % sign and convert to float).
+    Convert a grade column to an ordered categorical over GRADE_ORDER.
     
     Args:
-        df: DataFrame with int_rate column
+        grades: Series of loan grades (strings or categorical)
     
     Returns:
-        DataFrame with cleaned int_rate
+        Series with GRADE_DTYPE (returned unchanged if already encoded)
     """
-    df = df.copy()
+    if grades.dtype == GRADE_DTYPE:
+        return grades
+    return grades.astype(GRADE_DTYPE)
+
+def encode_categorical_columns(df: pd.DataFrame, verbose: bool = True) -> pd.DataFrame:
+    """
+    Convert grade and CATEGORICAL_COLUMNS to categorical dtype.
     
-    if df['int_rate'].dtype == 'object':
-        # Remove % sign and convert to float
-        df['int_rate'] = df['int_rate'].str.rstrip('%').astype(float)
-        print("✓ Cleaned interest rate column (removed % signs)")
+    Args:
+        df: DataFrame with raw string columns
+        verbose: Print a progress line
+    
+    Returns:
+        The same DataFrame, modified in place, with categorical columns
+    """
+    if 'grade' in df.columns:
+        df['grade'] = as_grade_categorical(df['grade'])
+    
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    
+    if verbose:
+        print("✓ Encoded grade/status/text columns as categoricals")
     
     return df
 
-def add_default_indicator(df: pd.DataFrame) -> pd.DataFrame:
+def clean_interest_rate(df: pd.DataFrame, verbose: bool = True) -> pd.DataFrame:
     """
-    Add binary default indicator column.
+    Clean interest rate column (remove % sign and convert to float).
     
     Args:
-        df: DataFrame with loan_status column
+        df: DataFrame with int_rate column (numeric, string or categorical)
+        verbose: Print a progress line
     
     Returns:
-        DataFrame with is_default column added
+        The same DataFrame, modified in place, with cleaned int_rate
     """
-    df = df.copy()
+    rates = df['int_rate']
+    
+    if pd.api.types.is_numeric_dtype(rates.dtype):
+        return df
+    
+    # Parse each distinct rate string once (a few hundred values, not one per
+    # loan) and scatter the results back through the integer codes
+    if isinstance(rates.dtype, pd.CategoricalDtype):
+        codes, uniques = rates.cat.codes.to_numpy(), rates.cat.categories
+    else:
+        codes, uniques = pd.factorize(rates)
+    
+    parsed = pd.Index(uniques).astype(str).str.rstrip('%').astype(np.float64)
+    # Trailing NaN slot so missing values (code -1) stay NaN
+    lookup = np.append(parsed.to_numpy(), np.nan)
+    df['int_rate'] = lookup[codes]
+    if verbose:
+        print("✓ Cleaned interest rate column (removed % signs)")
     
-    # Define default statuses
-    default_statuses = ['Charged Off', 'Default']
-    df['is_default'] = df['loan_status'].isin(default_statuses).astype(int)
+    return df
+
+def add_default_indicator(df: pd.DataFrame, verbose: bool = True) -> pd.DataFrame:
+    """
+    Add binary default indicator column and report the default count.
+    
+    Args:
+        df: DataFrame with loan_status column (an existing is_default
+            column is kept and only counted)
+        verbose: Print a progress line
     
-    default_count = df['is_default'].sum()
-    default_rate = (default_count / len(df)) * 100
+    Returns:
+        The same DataFrame, modified in place, with is_default column added
+    """
+    if 'is_default' not in df.columns:
+        df['is_default'] = _status_mask(df['loan_status'], DEFAULT_STATUSES)
     
-    print(f"✓ Added default indicator: {default_count:,} defaults ({default_rate:.1f}%)")
+    if verbose:
+        default_count = int(df['is_default'].to_numpy().sum())
+        default_rate = (default_count / len(df)) * 100
+        print(f"✓ Added default indicator: {default_count:,} defaults ({default_rate:.1f}%)")
     
     return df
 
-def clean_employment_length(df: pd.DataFrame) -> pd.DataFrame:
+def _status_mask(status: pd.Series, statuses: frozenset) -> np.ndarray:
+    """
+    Boolean array marking rows whose loan status is in statuses.
+    
+    Categorical columns are matched on their integer codes, so the strings
+    are only compared once per category.
+    """
+    if isinstance(status.dtype, pd.CategoricalDtype):
+        codes = status.cat.codes.to_numpy()
+        wanted = np.array([i for i, name in enumerate(status.cat.categories) if name in statuses],
+                          dtype=codes.dtype)
+        return np.isin(codes, wanted)
+    return status.isin(statuses).to_numpy()
+
+def clean_employment_length(df: pd.DataFrame, verbose: bool = True) -> pd.DataFrame:
     """
     Clean employment length column and convert to numeric years.
     
     Args:
         df: DataFrame with emp_length column
+        verbose: Print a progress line
     
     Returns:
-        DataFrame with cleaned emp_length_years column
-    """
-    df = df.copy()
-    
-    # Convert employment length to numeric years
-    def parse_emp_length(emp_str):
-        if pd.isna(emp_str):
-            return np.nan
-        if emp_str == '< 1 year':
-            return 0.5
-        elif emp_str == '10+ years':
-            return 10
-        elif 'year' in str(emp_str):
-            return float(str(emp_str).split()[0])
-        else:
-            return np.nan
-    
-    df['emp_length_years'] = df['emp_length'].apply(parse_emp_length)
-    print("✓ Converted employment length to numeric years")
+        The same DataFrame, modified in place, with cleaned emp_length_years column
+    """
+    # Convert employment length to numeric years with one vectorized lookup
+    df['emp_length_years'] = df['emp_length'].map(EMP_LENGTH_MAP).astype('float32')
+    if verbose:
+        print("✓ Converted employment length to numeric years")
     
     return df
 
@@ -155,19 +354,15 @@ def handle_missing_values(df: pd.DataFrame) -> pd.DataFrame:
         df: DataFrame to clean
     
     Returns:
-        DataFrame with missing values handled
+        The same DataFrame, modified in place, with missing values handled
     """
-    df = df.copy()
-    
-    # Fill missing annual income with median by grade
-    if 'annual_inc' in df.columns:
-        median_income_by_grade = df.groupby('grade')['annual_inc'].median()
-        df['annual_inc'] = df.groupby('grade')['annual_inc'].transform(
-            lambda x: x.fillna(x.median())
-        )
+    # Fill missing annual income with median by grade (skipped when nothing
+    # is missing, which is common after the grade/status filter)
+    if 'annual_inc' in df.columns and df['annual_inc'].isna().any():
+        df['annual_inc'] = fill_with_group_median(df['annual_inc'], df['grade'])
     
     # Fill missing employment years with median
-    if 'emp_length_years' in df.columns:
+    if 'emp_length_years' in df.columns and df['emp_length_years'].isna().any():
         median_emp = df['emp_length_years'].median()
         df['emp_length_years'] = df['emp_length_years'].fillna(median_emp)
     
@@ -175,6 +370,59 @@ def handle_missing_values(df: pd.DataFrame) -> pd.DataFrame:
     
     return df
 
+def fill_with_group_median(values: pd.Series, groups: pd.Series) -> np.ndarray:
+    """
+    Fill NaNs in a numeric column with the median of each row's group.
+    
+    Works on the integer group codes: medians are only computed for groups
+    that contain missing values, and rows with a missing group stay NaN.
+    
+    Args:
+        values: Numeric column with missing values
+        groups: Group labels (categorical or any factorizable column)
+    
+    Returns:
+        Array with the missing values filled (same dtype as values)
+    """
+    filled = values.to_numpy(copy=True)
+    missing = np.isnan(filled)
+    
+    if isinstance(groups.dtype, pd.CategoricalDtype):
+        codes = groups.cat.codes.to_numpy()
+    else:
+        codes, _ = pd.factorize(groups)
+    
+    for code in np.unique(codes[missing]):
+        if code < 0:
+            continue
+        in_group = codes == code
+        observed = filled[in_group & ~missing]
+        if len(observed):
+            filled[in_group & missing] = np.median(observed.astype(np.float64))
+    
+    return filled
+
+def downcast_numeric_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store FLOAT32_COLUMNS as float32 and the default flag as bool.
+    
+    Args:
+        df: Cleaned DataFrame
+    
+    Returns:
+        The same DataFrame, modified in place, with downcast numeric columns
+    """
+    for col in FLOAT32_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype(np.float32)
+    
+    if 'is_default' in df.columns:
+        df['is_default'] = df['is_default'].astype(bool)
+    
+    print("✓ Downcast numeric columns to float32/bool")
+    
+    return df
+
 def get_cleaning_summary(df_original: pd.DataFrame, df_clean: pd.DataFrame) -> dict:
     """
     Generate summary of cleaning process.
@@ -222,12 +470,14 @@ def validate_cleaned_data(df: pd.DataFrame) -> bool:
     if missing:
         checks.append(f"Missing required columns: {missing}")
     
-    # Check no missing values in critical columns
-    critical_missing = df[['grade', 'loan_status', 'is_default']].isnull().sum()
-    if critical_missing.sum() > 0:
-        checks.append(f"Missing values in critical columns: {critical_missing[critical_missing > 0].to_dict()}")
+    # Check no missing values in critical columns (only columns that have
+    # any missing values pay for the full count)
+    critical_missing = {col: int(df[col].isna().sum()) for col in required
+                        if col in df.columns and df[col].isna().any()}
+    if critical_missing:
+        checks.append(f"Missing values in critical columns: {critical_missing}")
     
-    # Check default indicator is binary
+    # Check default indicator is binary (bool flags pass: True == 1, False == 0)
     if 'is_default' in df.columns:
         unique_defaults = df['is_default'].unique()
         if not set(unique_defaults).issubset({0, 1}):
@@ -4,27 +4,96 @@ Data loading utilities for Lending Club analysis.
 
 import pandas as pd
 import numpy as np
-from typing import Tuple, List, Optional
+from typing import Tuple, List, Optional, Dict, Literal
 import os
+import hashlib
+import importlib.util
 
-def load_lending_club_data(filepath: str, sample_frac: Optional[float] = None) -> pd.DataFrame:
+# polars is optional and only imported when backend='polars' is used
+POLARS_AVAILABLE = importlib.util.find_spec('polars') is not None
+
+try:
+    from .data_cleaner import (ESSENTIAL_COLUMNS, POLARS_NULL_VALUES,
+                               clean_lending_club_data_streaming, encode_categorical_columns,
+                               add_default_indicator, handle_missing_values,
+                               downcast_numeric_columns)
+except ImportError:  # modules imported directly from src/ (e.g. the notebook)
+    from data_cleaner import (ESSENTIAL_COLUMNS, POLARS_NULL_VALUES,
+                              clean_lending_club_data_streaming, encode_categorical_columns,
+                              add_default_indicator, handle_missing_values,
+                              downcast_numeric_columns)
+
+# Parse-time dtypes for the essential columns. int_rate is read as a
+# category ('13.56%' in most extracts) so cleaning parses each rate once.
+LOAD_DTYPES = {
+    'grade': 'category',
+    'sub_grade': 'category',
+    'int_rate': 'category',
+    'loan_status': 'category',
+    'purpose': 'category',
+    'emp_length': 'category',
+    'loan_amnt': 'float32',
+    'annual_inc': 'float32'
+}
+
+def load_lending_club_data(filepath: str, sample_frac: Optional[float] = None,
+                           usecols: Optional[List[str]] = None,
+                           dtype: Optional[Dict[str, str]] = None,
+                           backend: Literal['pandas', 'pyarrow', 'polars'] = 'pyarrow',
+                           use_cache: bool = False,
+                           chunksize: Optional[int] = None) -> pd.DataFrame:
     """
     Load Lending Club dataset with initial validation and optional sampling.
     
     Args:
         filepath: Path to the Lending Club CSV file
         sample_frac: Fraction of data to sample (for testing with large files)
+        usecols: Columns to parse (uses ESSENTIAL_COLUMNS if None); columns
+            absent from the file are skipped
+        dtype: Column dtypes applied while parsing (uses LOAD_DTYPES if None)
+        backend: CSV reader - 'pyarrow' (multi-threaded pandas engine),
+            'polars' (multi-threaded, requires polars) or 'pandas' (C parser)
+        use_cache: Reuse (or write) a Parquet copy of the parsed columns next
+            to the CSV; it is rebuilt when the CSV is newer, and cache read or
+            write failures only print a warning
+        chunksize: If set, read the CSV in chunks of this many rows with the
+            pandas parser and clean each chunk as it is read; the returned
+            frame is then already cleaned (the cache is not used)
     
     Returns:
-        DataFrame with loaded data
+        DataFrame with loaded data (cleaned data when chunksize is set)
     """
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"Data file not found: {filepath}")
     
-    print(f"Loading data from: {filepath}")
+    if backend not in ('pandas', 'pyarrow', 'polars'):
+        raise ValueError(f"Unknown CSV backend: {backend}")
+    if backend == 'polars' and not POLARS_AVAILABLE:
+        raise ImportError("backend='polars' requires the polars package")
+    
+    if usecols is None:
+        usecols = ESSENTIAL_COLUMNS
+    if dtype is None:
+        dtype = LOAD_DTYPES
+    
+    # Only parse the requested columns that exist in the file
+    header = pd.read_csv(filepath, nrows=0).columns
+    usecols = [col for col in usecols if col in header]
+    dtype = {col: dt for col, dt in dtype.items() if col in usecols}
     
-    # Load with low_memory=False to avoid mixed type warnings
-    df = pd.read_csv(filepath, low_memory=False)
+    cache_path = _cache_path(filepath, usecols, dtype)
+    df = None
+    if chunksize:
+        print(f"Loading and cleaning data from: {filepath} ({chunksize:,}-row chunks)")
+        df = _load_and_clean_chunks(filepath, usecols, dtype, chunksize)
+    elif use_cache:
+        df = _read_cache(cache_path, filepath)
+    
+    if df is None:
+        print(f"Loading data from: {filepath} ({backend} reader)")
+        df = _read_csv(filepath, usecols, dtype, backend)
+        if use_cache:
+            _write_cache(df, cache_path)
     
     print(f"Rows: {df.shape[0]:,}, Columns: {df.shape[1]}")
     
@@ -35,6 +104,92 @@ def load_lending_club_data(filepath: str, sample_frac: Optional[float] = None) -
     
     return df
 
+def _load_and_clean_chunks(filepath: str, usecols: List[str], dtype: Dict[str, str],
+                           chunksize: int) -> pd.DataFrame:
+    """
+    Read the CSV chunk by chunk, cleaning each chunk before the next is read.
+    
+    Only the cleaned chunks are kept, so the full raw frame never exists in
+    memory. Imputation and downcasting run once on the combined result.
+    """
+    reader = pd.read_csv(filepath, usecols=usecols, dtype=dtype, chunksize=chunksize)
+    chunks = []
+    n_read = 0
+    for chunk in reader:
+        n_read += len(chunk)
+        chunks.append(clean_lending_club_data_streaming(chunk, usecols, verbose=False))
+    
+    df = pd.concat(chunks, ignore_index=True)
+    print(f"Read {n_read:,} rows in {len(chunks)} chunks; kept {len(df):,} completed loans "
+          f"(removed {n_read - len(df):,})")
+    
+    # Chunks can see different category sets, which concat turns into objects
+    df = encode_categorical_columns(df)
+    df = add_default_indicator(df)
+    df = handle_missing_values(df)
+    df = downcast_numeric_columns(df)
+    
+    return df
+
+def _cache_path(filepath: str, usecols: List[str], dtype: Dict[str, str]) -> str:
+    """
+    Parquet cache location for a CSV, keyed by the parsed columns and dtypes.
+    """
+    key = repr((usecols, sorted(dtype.items()))).encode()
+    digest = hashlib.md5(key).hexdigest()[:10]
+    return f"{os.path.splitext(filepath)[0]}.{digest}.parquet"
+
+def _read_cache(cache_path: str, filepath: str) -> Optional[pd.DataFrame]:
+    """
+    Read the Parquet cache if it exists and is at least as new as the CSV.
+    
+    Returns None (so the caller parses the CSV) when there is no usable cache.
+    """
+    if not os.path.exists(cache_path) or \
+            os.path.getmtime(cache_path) < os.path.getmtime(filepath):
+        return None
+    
+    try:
+        df = pd.read_parquet(cache_path, engine='pyarrow')
+    except Exception as e:
+        print(f"Warning: ignoring unreadable cache {cache_path}: {e}")
+        return None
+    
+    print(f"Loading data from cache: {cache_path}")
+    return df
+
+def _write_cache(df: pd.DataFrame, cache_path: str) -> None:
+    """
+    Write the Parquet cache atomically (temp file, then os.replace), so an
+    interrupted write never leaves a truncated cache behind.
+    """
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        df.to_parquet(tmp_path, engine='pyarrow', compression='snappy', index=False)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"Warning: could not write cache {cache_path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _read_csv(filepath: str, usecols: List[str], dtype: Dict[str, str],
+              backend: str) -> pd.DataFrame:
+    """
+    Parse the selected CSV columns with the requested backend.
+    """
+    if backend == 'polars':
+        import polars as pl
+        # Projection is pushed into the scan; dtypes applied after conversion
+        df = pl.scan_csv(filepath, null_values=POLARS_NULL_VALUES).select(usecols).collect().to_pandas()
+        df = df.astype(dtype)
+    elif backend == 'pyarrow':
+        df = pd.read_csv(filepath, usecols=usecols, dtype=dtype, engine='pyarrow')
+    else:
+        # Load with low_memory=False to avoid mixed type warnings
+        df = pd.read_csv(filepath, usecols=usecols, dtype=dtype, low_memory=False)
+    
+    return df
+
 def validate_required_columns(df: pd.DataFrame, required_cols: List[str]) -> bool:
     """
     Make sure all required columns are in the DataFrame.
@@ -47,15 +202,26 @@ def validate_required_columns(df: pd.DataFrame, required_cols: List[str]) -> boo
     print(f"All required columns found: {required_cols}")
     return True
 
-def get_basic_info(df: pd.DataFrame) -> dict:
+def get_basic_info(df: pd.DataFrame, detailed: bool = False) -> dict:
     """
     Print basic info about the dataset.
+    
+    Exact duplicate rows (a hash over every column) are only counted when
+    detailed=True; otherwise duplicates are counted on the 'id' column if
+    present and reported as None if not.
     """
+    if detailed:
+        duplicate_rows = int(df.duplicated().sum())
+    elif 'id' in df.columns:
+        duplicate_rows = len(df) - df['id'].nunique()
+    else:
+        duplicate_rows = None
+    
     info = {
         'shape': df.shape,
         'memory_usage_mb': df.memory_usage(deep=True).sum() / 1024**2,
-        'null_counts': df.isnull().sum().sum(),
-        'duplicate_rows': df.duplicated().sum(),
+        'null_counts': int(df.isna().to_numpy().sum()),
+        'duplicate_rows': duplicate_rows,
         'numeric_columns': len(df.select_dtypes(include=[np.number]).columns),
         'object_columns': len(df.select_dtypes(include=['object']).columns)
     }
@@ -64,7 +230,10 @@ def get_basic_info(df: pd.DataFrame) -> dict:
     print(f"Rows: {info['shape'][0]:,}, Columns: {info['shape'][1]}")
     print(f"Memory usage: {info['memory_usage_mb']:.1f} MB")
     print(f"Null values: {info['null_counts']:,}")
-    print(f"Duplicate rows: {info['duplicate_rows']:,}")
+    if duplicate_rows is None:
+        print("Duplicate rows: not checked (pass detailed=True)")
+    else:
+        print(f"Duplicate rows: {duplicate_rows:,}")
     print(f"Numeric columns: {info['numeric_columns']}")
     print(f"Object columns: {info['object_columns']}")
     
@@ -79,11 +248,12 @@ def preview_loan_statuses(df: pd.DataFrame) -> pd.Series:
         return pd.Series(dtype=int)
     
     status_counts = df['loan_status'].value_counts(dropna=False)
+    pcts = status_counts.to_numpy() / len(df) * 100
     
-    print("\nLoan status breakdown:")
-    for status, count in status_counts.items():
-        pct = (count / len(df)) * 100
-        print(f"{status}: {count:,} ({pct:.1f}%)")
+    # Build the breakdown as one string and print it once
+    lines = [f"{status}: {count:,} ({pct:.1f}%)"
+             for status, count, pct in zip(status_counts.index, status_counts.to_numpy(), pcts)]
+    print("\nLoan status breakdown:\n" + "\n".join(lines))
     
     return status_counts
 
@@ -95,11 +265,11 @@ def preview_grades(df: pd.DataFrame) -> pd.Series:
         print("Warning: 'grade' column not found")
         return pd.Series(dtype=int)
     
-    grade_counts = df['grade'].value_counts().sort_index()
+    grade_counts = df['grade'].value_counts(sort=False).sort_index()
+    pcts = grade_counts.to_numpy() / len(df) * 100
     
-    print("\nGrade breakdown:")
-    for grade, count in grade_counts.items():
-        pct = (count / len(df)) * 100
-        print(f"Grade {grade}: {count:,} ({pct:.1f}%)")
+    lines = [f"Grade {grade}: {count:,} ({pct:.1f}%)"
+             for grade, count, pct in zip(grade_counts.index, grade_counts.to_numpy(), pcts)]
+    print("\nGrade breakdown:\n" + "\n".join(lines))
     
     return grade_counts
\ No newline at end of file
@@ -9,10 +9,18 @@ import numpy as np
 from typing import Optional, Tuple, List
 import os
 
+try:
+    from .data_cleaner import GRADE_ORDER, as_grade_categorical
+except ImportError:  # modules imported directly from src/ (e.g. the notebook)
+    from data_cleaner import GRADE_ORDER, as_grade_categorical
+
 # Set style and color palette
 plt.style.use('seaborn-v0_8-whitegrid')
 sns.set_palette("husl")
 
+# PNG encoder settings: a fixed zlib level skips Pillow's filter auto-selection
+PNG_PIL_KWARGS = {'compress_level': 3, 'optimize': False}
+
 def setup_plot_style():
     """Configure matplotlib and seaborn for publication-quality plots."""
     plt.rcParams.update({
@@ -25,37 +33,92 @@ def setup_plot_style():
         'figure.titlesize': 16
     })
 
+# Applied once at import rather than inside every plotting call
+setup_plot_style()
+
+# RdYlBu_r sampled once; indexing it matches calling the colormap directly
+_RDYLBU_R_LUT = plt.cm.RdYlBu_r(np.linspace(0, 1, plt.cm.RdYlBu_r.N))
+
+def _rdylbu_r_colors(values: np.ndarray) -> np.ndarray:
+    """Map values in [0, 1] through _RDYLBU_R_LUT like calling the colormap
+    (out-of-range values clamp to the ends, NaN gets the 'bad' colour)."""
+    scaled = np.nan_to_num(values * len(_RDYLBU_R_LUT), nan=0.0)
+    lut_idx = np.clip(scaled, 0, len(_RDYLBU_R_LUT) - 1).astype(np.intp)
+    colors = _RDYLBU_R_LUT[lut_idx]
+    colors[np.isnan(values)] = plt.cm.RdYlBu_r.get_bad()
+    return colors
+
+def _grade_codes(grade_metrics: pd.DataFrame) -> np.ndarray:
+    """Return grade rank codes (A=0 ... G=6) for colouring; other labels
+    (e.g. sub-grades) are ranked by their sorted categories instead."""
+    grades = grade_metrics['grade']
+    if grades.isin(GRADE_ORDER).all():
+        return as_grade_categorical(grades).cat.codes.to_numpy()
+    return grades.astype('category').cat.codes.to_numpy()
+
+def _save_figure(save_path: str) -> None:
+    """Save the current figure at 300 dpi in a single render pass."""
+    savefig_kwargs = {'dpi': 300}
+    if save_path.lower().endswith('.png'):
+        savefig_kwargs['pil_kwargs'] = PNG_PIL_KWARGS
+    plt.savefig(save_path, **savefig_kwargs)
+
+def _finish_plot(save_path: Optional[str] = None, kind: str = 'plot') -> None:
+    """Lay out, optionally save, and show the current figure."""
+    plt.tight_layout()
+    
+    if save_path:
+        _save_figure(save_path)
+        print(f"Saved {kind} to: {save_path}")
+    
+    plt.show()
+
 def plot_default_rate_by_grade(grade_metrics: pd.DataFrame, 
-                              save_path: Optional[str] = None) -> None:
+                              save_path: Optional[str] = None,
+                              ax: Optional[plt.Axes] = None,
+                              compact: bool = False) -> None:
     """
     Create bar chart of default rates by loan grade.
     
     Args:
         grade_metrics: DataFrame with grade-level metrics
         save_path: Optional path to save the plot
+        ax: Optional Axes to draw into (figure is then left to the caller)
+        compact: Dashboard panel style (no title, legend or 25% line)
     """
-    setup_plot_style()
+    own_figure = ax is None
+    if own_figure:
+        fig, ax = plt.subplots(figsize=(12, 8))
     
-    fig, ax = plt.subplots(figsize=(12, 8))
+    default_rate = grade_metrics['default_rate_pct'].to_numpy(dtype=np.float64)
+    max_rate = grade_metrics['default_rate_pct'].max()
     
-    # Create color map based on default rate
-    colors = plt.cm.RdYlBu_r(grade_metrics['default_rate_pct'] / grade_metrics['default_rate_pct'].max())
+    # Create color map based on default rate (no defaults at all -> 'bad' colour,
+    # as the colormap does for 0/0)
+    with np.errstate(invalid='ignore'):
+        rate_norm = default_rate / max_rate if max_rate > 0 else np.full_like(default_rate, np.nan)
+    colors = _rdylbu_r_colors(rate_norm)
     
     # Create bars
+    edge_kwargs = {} if compact else {'edgecolor': 'black', 'linewidth': 0.5}
     bars = ax.bar(grade_metrics['grade'], 
-                  grade_metrics['default_rate_pct'],
+                  default_rate,
                   color=colors, 
                   alpha=0.8,
-                  edgecolor='black',
-                  linewidth=0.5)
+                  **edge_kwargs)
+    for bar in bars:
+        bar.set_rasterized(True)
     
     # Add value labels on bars
-    for bar, rate in zip(bars, grade_metrics['default_rate_pct']):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2, height + 0.5,
-                f'{rate:.1f}%', 
-                ha='center', va='bottom', 
-                fontweight='bold', fontsize=11)
+    ax.bar_label(bars, labels=[f'{rate:.1f}%' for rate in default_rate],
+                 padding=3, fontweight='bold', fontsize=None if compact else 11)
+    
+    if compact:
+        ax.set_ylabel('Default Rate (%)')
+        ax.axhline(y=15, color='red', linestyle='--', alpha=0.7)
+        if own_figure:
+            _finish_plot(save_path)
+        return
     
     # Styling
     ax.set_title('Loan Default Rate by Grade\n(Higher Risk Grades Show Elevated Default Rates)', 
@@ -71,57 +134,71 @@ def plot_default_rate_by_grade(grade_metrics: pd.DataFrame,
     
     ax.legend(loc='upper left')
     ax.grid(axis='y', alpha=0.3)
-    ax.set_ylim(0, max(30, grade_metrics['default_rate_pct'].max() * 1.15))
-    
-    plt.tight_layout()
-    
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        print(f"Saved plot to: {save_path}")
+    ax.set_ylim(0, max(30, max_rate * 1.15))
     
-    plt.show()
+    if own_figure:
+        _finish_plot(save_path)
 
 def plot_risk_return_analysis(grade_metrics: pd.DataFrame, 
-                             save_path: Optional[str] = None) -> None:
+                             save_path: Optional[str] = None,
+                             ax: Optional[plt.Axes] = None,
+                             compact: bool = False) -> None:
     """
     Create scatter plot showing risk-return relationship with volume indicators.
     
     Args:
         grade_metrics: DataFrame with grade-level metrics
         save_path: Optional path to save the plot
+        ax: Optional Axes to draw into (figure is then left to the caller)
+        compact: Dashboard panel style (smaller bubbles; no labels, trend
+            line or colorbar)
     """
-    setup_plot_style()
+    own_figure = ax is None
+    if own_figure:
+        fig, ax = plt.subplots(figsize=(12, 8))
     
-    fig, ax = plt.subplots(figsize=(12, 8))
+    default_rate = grade_metrics['default_rate_pct'].to_numpy(dtype=np.float64)
+    interest_rate = grade_metrics['avg_interest_rate'].to_numpy(dtype=np.float64)
+    volume = grade_metrics['total_volume'].to_numpy(dtype=np.float64)
     
     # Normalize volume for bubble size
-    max_volume = grade_metrics['total_volume'].max()
-    sizes = (grade_metrics['total_volume'] / max_volume) * 1000 + 100
+    if compact:
+        sizes = (volume / volume.max()) * 300 + 50
+    else:
+        sizes = (volume / volume.max()) * 1000 + 100
     
     # Create scatter plot
-    scatter = ax.scatter(grade_metrics['default_rate_pct'], 
-                        grade_metrics['avg_interest_rate'],
+    edge_kwargs = {} if compact else {'edgecolors': 'black', 'linewidth': 1}
+    scatter = ax.scatter(default_rate, 
+                        interest_rate,
                         s=sizes,
-                        c=grade_metrics['grade'].astype('category').cat.codes,
+                        c=_grade_codes(grade_metrics),
                         cmap='viridis', 
                         alpha=0.7,
-                        edgecolors='black',
-                        linewidth=1)
+                        **edge_kwargs)
+    scatter.set_rasterized(True)
+    
+    if compact:
+        ax.set_xlabel('Default Rate (%)')
+        ax.set_ylabel('Interest Rate (%)')
+        if own_figure:
+            _finish_plot(save_path)
+        return
     
     # Add grade labels
-    for idx, row in grade_metrics.iterrows():
-        ax.annotate(f"Grade {row['grade']}", 
-                   (row['default_rate_pct'], row['avg_interest_rate']),
+    for grade, x, y in zip(grade_metrics['grade'], default_rate, interest_rate):
+        ax.annotate(f"Grade {grade}", 
+                   (x, y),
                    xytext=(8, 8), 
                    textcoords='offset points',
                    fontweight='bold',
                    bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8))
     
     # Add trend line
-    z = np.polyfit(grade_metrics['default_rate_pct'], grade_metrics['avg_interest_rate'], 1)
+    z = np.polyfit(default_rate, interest_rate, 1)
     p = np.poly1d(z)
-    ax.plot(grade_metrics['default_rate_pct'], p(grade_metrics['default_rate_pct']), 
-            "r--", alpha=0.8, label=f'Trend line (R² = {np.corrcoef(grade_metrics["default_rate_pct"], grade_metrics["avg_interest_rate"])[0,1]**2:.3f})')
+    ax.plot(default_rate, p(default_rate), 
+            "r--", alpha=0.8, label=f'Trend line (R² = {np.corrcoef(default_rate, interest_rate)[0,1]**2:.3f})')
     
     ax.set_xlabel('Default Rate (%)', fontsize=13, fontweight='bold')
     ax.set_ylabel('Average Interest Rate (%)', fontsize=13, fontweight='bold')
@@ -129,35 +206,41 @@ def plot_risk_return_analysis(grade_metrics: pd.DataFrame,
                 fontsize=16, fontweight='bold', pad=20)
     
     # Add colorbar
-    cbar = plt.colorbar(scatter, ax=ax)
+    cbar = ax.figure.colorbar(scatter, ax=ax)
     cbar.set_label('Grade Rank', fontsize=12)
     
     ax.legend()
     ax.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        print(f"Saved plot to: {save_path}")
-    
-    plt.show()
+    if own_figure:
+        _finish_plot(save_path)
 
 def plot_volume_distribution(grade_metrics: pd.DataFrame, 
-                           save_path: Optional[str] = None) -> None:
+                           save_path: Optional[str] = None,
+                           ax: Optional[plt.Axes] = None,
+                           compact: bool = False) -> None:
     """
     Create pie chart showing loan volume distribution by grade.
     
     Args:
         grade_metrics: DataFrame with grade-level metrics
         save_path: Optional path to save the plot
+        ax: Optional Axes to draw into (figure is then left to the caller)
+        compact: Dashboard panel style (default palette and text, no title)
     """
-    setup_plot_style()
-    
-    fig, ax = plt.subplots(figsize=(10, 8))
+    own_figure = ax is None
+    if own_figure:
+        fig, ax = plt.subplots(figsize=(10, 8))
     
     # Create pie chart
-    wedges, texts, autotexts = ax.pie(grade_metrics['volume_share_pct'],
+    if compact:
+        ax.pie(grade_metrics['volume_share_pct'].to_numpy(), labels=grade_metrics['grade'],
+               autopct='%1.1f%%', startangle=90)
+        if own_figure:
+            _finish_plot(save_path)
+        return
+    
+    wedges, texts, autotexts = ax.pie(grade_metrics['volume_share_pct'].to_numpy(),
                                       labels=grade_metrics['grade'],
                                       autopct='%1.1f%%',
                                       startangle=90,
@@ -176,28 +259,28 @@ def plot_volume_distribution(grade_metrics: pd.DataFrame,
     ax.set_title('Loan Volume Distribution by Grade\n(Percentage of Total Portfolio)', 
                 fontsize=16, fontweight='bold', pad=20)
     
-    plt.tight_layout()
-    
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        print(f"Saved plot to: {save_path}")
-    
-    plt.show()
+    if own_figure:
+        _finish_plot(save_path)
 
 def plot_grade_comparison_heatmap(grade_metrics: pd.DataFrame, 
                                  metrics_to_show: Optional[List[str]] = None,
-                                 save_path: Optional[str] = None) -> None:
+                                 save_path: Optional[str] = None,
+                                 ax: Optional[plt.Axes] = None) -> None:
     """
-    Make a heatmap to compare key metrics across grades. Shows how each grade stacks up for things like default rate, interest rate, loan amount, and volume share.
+    Make a heatmap to compare key metrics across grades. Shows how each grade stacks up for things like default rate, interest rate, loan amount, and volume share. Pass ax to draw into an existing figure.
     """
     if metrics_to_show is None:
         metrics_to_show = ['default_rate_pct', 'avg_interest_rate', 'avg_loan_amount', 'volume_share_pct']
-    setup_plot_style()
     heatmap_data = grade_metrics.set_index('grade')[metrics_to_show].T
-    heatmap_data_norm = heatmap_data.div(heatmap_data.max(axis=1), axis=0)
-    fig, ax = plt.subplots(figsize=(10, 6))
-    sns.heatmap(heatmap_data_norm, 
-                annot=heatmap_data.round(1), 
+    values = heatmap_data.to_numpy(dtype=np.float64)
+    values_norm = values / values.max(axis=1, keepdims=True)
+    own_figure = ax is None
+    if own_figure:
+        fig, ax = plt.subplots(figsize=(10, 6))
+    sns.heatmap(values_norm, 
+                annot=values.round(1), 
+                xticklabels=heatmap_data.columns,
+                yticklabels=heatmap_data.index,
                 cmap='RdYlBu_r',
                 center=0.5,
                 fmt='g',
@@ -213,11 +296,8 @@ def plot_grade_comparison_heatmap(grade_metrics: pd.DataFrame,
         'volume_share_pct': 'Volume Share (%)'
     }
     ax.set_yticklabels([metric_labels.get(m, m) for m in metrics_to_show], rotation=0)
-    plt.tight_layout()
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        print(f"Saved plot to: {save_path}")
-    plt.show()
+    if own_figure:
+        _finish_plot(save_path)
 
 def create_executive_dashboard(grade_metrics: pd.DataFrame, 
                               portfolio_metrics: dict,
@@ -230,34 +310,16 @@ def create_executive_dashboard(grade_metrics: pd.DataFrame,
         portfolio_metrics: Dictionary with portfolio-level metrics
         save_path: Optional path to save the plot
     """
-    setup_plot_style()
-    
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
     
-    # 1. Default Rate Bar Chart
-    colors = plt.cm.RdYlBu_r(grade_metrics['default_rate_pct'] / grade_metrics['default_rate_pct'].max())
-    bars = ax1.bar(grade_metrics['grade'], grade_metrics['default_rate_pct'], color=colors, alpha=0.8)
+    # 1-3. Reuse the standalone plotters in their compact panel style
+    plot_default_rate_by_grade(grade_metrics, ax=ax1, compact=True)
     ax1.set_title('Default Rate by Grade', fontweight='bold')
-    ax1.set_ylabel('Default Rate (%)')
-    ax1.axhline(y=15, color='red', linestyle='--', alpha=0.7)
-    
-    # Add value labels
-    for bar, rate in zip(bars, grade_metrics['default_rate_pct']):
-        ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5,
-                f'{rate:.1f}%', ha='center', va='bottom', fontweight='bold')
-    
-    # 2. Risk-Return Scatter
-    sizes = (grade_metrics['total_volume'] / grade_metrics['total_volume'].max()) * 300 + 50
-    scatter = ax2.scatter(grade_metrics['default_rate_pct'], grade_metrics['avg_interest_rate'],
-                         s=sizes, c=grade_metrics['grade'].astype('category').cat.codes,
-                         cmap='viridis', alpha=0.7)
+    
+    plot_risk_return_analysis(grade_metrics, ax=ax2, compact=True)
     ax2.set_title('Risk vs Return (Size = Volume)', fontweight='bold')
-    ax2.set_xlabel('Default Rate (%)')
-    ax2.set_ylabel('Interest Rate (%)')
     
-    # 3. Volume Distribution
-    ax3.pie(grade_metrics['volume_share_pct'], labels=grade_metrics['grade'],
-            autopct='%1.1f%%', startangle=90)
+    plot_volume_distribution(grade_metrics, ax=ax3, compact=True)
     ax3.set_title('Volume Distribution', fontweight='bold')
     
     # 4. Key Metrics Text Summary
@@ -282,13 +344,7 @@ def create_executive_dashboard(grade_metrics: pd.DataFrame,
     
     plt.suptitle('Lending Club Portfolio Analysis - Executive Dashboard', 
                 fontsize=18, fontweight='bold', y=0.98)
-    plt.tight_layout()
-    
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        print(f"Saved dashboard to: {save_path}")
-    
-    plt.show()
+    _finish_plot(save_path, kind='dashboard')
 
 
 def save_all_visualizations(grade_metrics: pd.DataFrame, 